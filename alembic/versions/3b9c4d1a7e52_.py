@@ -0,0 +1,148 @@
+"""atletas_leitura
+
+Revision ID: 3b9c4d1a7e52
+Revises: e05bedde27ca
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9c4d1a7e52'
+down_revision: Union[str, Sequence[str], None] = 'e05bedde27ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SELECT_ORIGEM = """
+    SELECT a.pk_id, a.id, a.nome, a.cpf, a.idade, a.peso, a.altura, a.sexo, a.created_at,
+           a.categoria_id, c.nome, a.centro_treinamento_id, ct.nome
+    FROM atletas a
+    JOIN categorias c ON c.pk_id = a.categoria_id
+    JOIN centros_treinamento ct ON ct.pk_id = a.centro_treinamento_id
+"""
+
+# Colunas devolvidas pela listagem e pela busca, incluídas nos índices para permitir index-only scans
+COLUNAS_COBERTAS = [
+    'pk_id', 'id', 'nome', 'cpf', 'idade', 'peso', 'altura', 'sexo', 'created_at',
+    'categoria_nome', 'centro_treinamento_nome'
+]
+
+COLUNAS = """
+    pk_id, id, nome, cpf, idade, peso, altura, sexo, created_at,
+    categoria_id, categoria_nome, centro_treinamento_id, centro_treinamento_nome
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('atletas_leitura',
+    sa.Column('pk_id', sa.Integer(), nullable=False),
+    sa.Column('nome', sa.String(length=50), nullable=False),
+    sa.Column('cpf', sa.String(length=11), nullable=False),
+    sa.Column('idade', sa.Integer(), nullable=False),
+    sa.Column('peso', sa.Float(), nullable=False),
+    sa.Column('altura', sa.Float(), nullable=False),
+    sa.Column('sexo', sa.String(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('categoria_id', sa.Integer(), nullable=False),
+    sa.Column('categoria_nome', sa.String(length=50), nullable=False),
+    sa.Column('centro_treinamento_id', sa.Integer(), nullable=False),
+    sa.Column('centro_treinamento_nome', sa.String(length=20), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.PrimaryKeyConstraint('pk_id')
+    )
+    for nome, coluna, unique in [
+        ('ix_atletas_leitura_listagem', 'pk_id', False),
+        ('ix_atletas_leitura_id', 'id', False),
+        ('ix_atletas_leitura_nome', 'nome', False),
+        ('ix_atletas_leitura_cpf', 'cpf', True),
+    ]:
+        op.create_index(nome, 'atletas_leitura', [coluna], unique=unique, postgresql_include=[
+            c for c in COLUNAS_COBERTAS if c != coluna
+        ])
+    op.create_index(op.f('ix_atletas_leitura_categoria_id'), 'atletas_leitura', ['categoria_id'], unique=False)
+    op.create_index(op.f('ix_atletas_leitura_centro_treinamento_id'), 'atletas_leitura', ['centro_treinamento_id'], unique=False)
+
+    # Triggers que mantêm atletas_leitura sincronizada com atletas, categorias e centros_treinamento
+    op.execute(f"""
+        CREATE FUNCTION atletas_leitura_sync_atleta() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                DELETE FROM atletas_leitura WHERE pk_id = OLD.pk_id;
+                RETURN OLD;
+            END IF;
+            IF TG_OP = 'UPDATE' AND OLD.pk_id <> NEW.pk_id THEN
+                DELETE FROM atletas_leitura WHERE pk_id = OLD.pk_id;
+            END IF;
+            INSERT INTO atletas_leitura ({COLUNAS})
+            {SELECT_ORIGEM}
+            WHERE a.pk_id = NEW.pk_id
+            ON CONFLICT (pk_id) DO UPDATE SET
+                id = EXCLUDED.id, nome = EXCLUDED.nome, cpf = EXCLUDED.cpf, idade = EXCLUDED.idade,
+                peso = EXCLUDED.peso, altura = EXCLUDED.altura, sexo = EXCLUDED.sexo,
+                created_at = EXCLUDED.created_at, categoria_id = EXCLUDED.categoria_id,
+                categoria_nome = EXCLUDED.categoria_nome,
+                centro_treinamento_id = EXCLUDED.centro_treinamento_id,
+                centro_treinamento_nome = EXCLUDED.centro_treinamento_nome;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION atletas_leitura_sync_categoria() RETURNS trigger AS $$
+        BEGIN
+            UPDATE atletas_leitura SET categoria_nome = NEW.nome WHERE categoria_id = NEW.pk_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION atletas_leitura_sync_centro_treinamento() RETURNS trigger AS $$
+        BEGIN
+            UPDATE atletas_leitura SET centro_treinamento_nome = NEW.nome WHERE centro_treinamento_id = NEW.pk_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_leitura_atleta
+        AFTER INSERT OR UPDATE OR DELETE ON atletas
+        FOR EACH ROW EXECUTE FUNCTION atletas_leitura_sync_atleta()
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_leitura_categoria
+        AFTER UPDATE OF nome ON categorias
+        FOR EACH ROW WHEN (OLD.nome IS DISTINCT FROM NEW.nome)
+        EXECUTE FUNCTION atletas_leitura_sync_categoria()
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_leitura_centro_treinamento
+        AFTER UPDATE OF nome ON centros_treinamento
+        FOR EACH ROW WHEN (OLD.nome IS DISTINCT FROM NEW.nome)
+        EXECUTE FUNCTION atletas_leitura_sync_centro_treinamento()
+    """)
+
+    # Carga inicial com os atletas já existentes
+    op.execute(f"INSERT INTO atletas_leitura ({COLUNAS}) {SELECT_ORIGEM}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS atletas_leitura_centro_treinamento ON centros_treinamento")
+    op.execute("DROP TRIGGER IF EXISTS atletas_leitura_categoria ON categorias")
+    op.execute("DROP TRIGGER IF EXISTS atletas_leitura_atleta ON atletas")
+    op.execute("DROP FUNCTION IF EXISTS atletas_leitura_sync_centro_treinamento()")
+    op.execute("DROP FUNCTION IF EXISTS atletas_leitura_sync_categoria()")
+    op.execute("DROP FUNCTION IF EXISTS atletas_leitura_sync_atleta()")
+    op.drop_index(op.f('ix_atletas_leitura_centro_treinamento_id'), table_name='atletas_leitura')
+    op.drop_index(op.f('ix_atletas_leitura_categoria_id'), table_name='atletas_leitura')
+    op.drop_index('ix_atletas_leitura_cpf', table_name='atletas_leitura')
+    op.drop_index('ix_atletas_leitura_nome', table_name='atletas_leitura')
+    op.drop_index('ix_atletas_leitura_id', table_name='atletas_leitura')
+    op.drop_index('ix_atletas_leitura_listagem', table_name='atletas_leitura')
+    op.drop_table('atletas_leitura')
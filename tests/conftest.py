@@ -0,0 +1,63 @@
+import os
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+# O SQLite não tem os triggers que mantêm atletas_leitura, então a API lê das tabelas normalizadas
+os.environ["LEITURA_ATLETAS"] = "false"
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.config.database import get_session
+from workout_api.contrib.models import BaseModel
+from workout_api.main import app
+
+
+@pytest.fixture
+def db(tmp_path):
+    # Banco SQLite em arquivo: as tabelas e os dados são criados de forma síncrona
+    # e a API acessa o mesmo arquivo pelo aiosqlite
+    caminho = tmp_path / "workout.db"
+    engine = create_engine(f"sqlite:///{caminho}")
+    BaseModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        categoria = CategoriaModel(id=uuid4(), nome="Scale")
+        centro = CentroTreinamentoModel(id=uuid4(), nome="CT King", endereco="Rua X, Q2", proprietario="Marcos")
+        session.add_all([categoria, centro])
+        session.flush()
+        session.add(AtletaModel(
+            id=uuid4(), nome="João", cpf="12345678900", idade=25, peso=85.5, altura=1.83, sexo="H",
+            created_at=datetime.now(), categoria_id=categoria.pk_id, centro_treinamento_id=centro.pk_id
+        ))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(db):
+    yield from cliente_para(f"sqlite+aiosqlite:///{db.url.database}")
+
+
+def cliente_para(url: str):
+    # NullPool: as conexões não são reaproveitadas entre o event loop do TestClient e o dos testes
+    async_engine = create_async_engine(url, poolclass=NullPool)
+    async_session = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_session
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
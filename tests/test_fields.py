@@ -0,0 +1,73 @@
+from workout_api.atleta.schemas import AtletaOut
+from workout_api.contrib.fields import build_schema
+
+
+def test_categorias_fields(client):
+    resposta = client.get("/categorias/", params={"fields": "nome"})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == [{"nome": "Scale"}]
+    assert resposta.json()["total"] == 1
+
+    resposta = client.get("/categorias/", params={"fields": "id,nome"})
+    assert resposta.status_code == 200
+    assert list(resposta.json()["items"][0]) == ["id", "nome"]
+
+
+def test_centro_treinamento_fields(client):
+    resposta = client.get("/centro_treinamento/", params={"fields": "nome,proprietario"})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == [{"nome": "CT King", "proprietario": "Marcos"}]
+
+
+def test_atletas_fields(client):
+    resposta = client.get("/atletas/get_all", params={"fields": "nome,categoria"})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == [{"nome": "João", "categoria": {"nome": "Scale"}}]
+
+    resposta = client.get("/atletas/", params={"cpf": "12345678900", "fields": "cpf,centro_treinamento"})
+    assert resposta.status_code == 200
+    assert resposta.json() == [{"cpf": "12345678900", "centro_treinamento": {"nome": "CT King"}}]
+
+
+def test_fields_invalido(client):
+    resposta = client.get("/categorias/", params={"fields": "nome,senha"})
+    assert resposta.status_code == 400
+
+
+def test_sem_fields(client):
+    resposta = client.get("/categorias/")
+    assert resposta.status_code == 200
+    assert resposta.json()["items"][0]["nome"] == "Scale"
+
+    resposta = client.get("/atletas/get_all")
+    assert resposta.status_code == 200
+    assert resposta.json()["items"][0]["categoria"] == {"nome": "Scale"}
+
+
+def test_atletas_filtros_antigos(client):
+    resposta = client.get("/atletas/get_all", params={"nome": True, "categoria": True})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == [{"nome": "João", "categoria": "Scale"}]
+
+
+def test_schema_por_conjunto_de_campos(client):
+    assert build_schema(AtletaOut, ("nome", "cpf")) is build_schema(AtletaOut, ("cpf", "nome"))
+
+    resposta = client.get("/atletas/get_all", params={"fields": "cpf,nome"})
+    assert list(resposta.json()["items"][0]) == ["cpf", "nome"]
+
+
+def test_atletas_fields_com_dois_joins(client):
+    resposta = client.get("/atletas/get_all", params={"fields": "categoria,centro_treinamento"})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == [{"categoria": {"nome": "Scale"}, "centro_treinamento": {"nome": "CT King"}}]
+
+    resposta = client.get("/atletas/", params={"nome": "João", "fields": "categoria,centro_treinamento"})
+    assert resposta.status_code == 200
+    assert resposta.json() == [{"categoria": {"nome": "Scale"}, "centro_treinamento": {"nome": "CT King"}}]
+
+
+def test_atletas_filtros_antigos_com_dois_joins(client):
+    resposta = client.get("/atletas/get_all", params={"categoria": True, "centro_treinamento": True})
+    assert resposta.status_code == 200
+    assert resposta.json()["items"] == [{"categoria": "Scale", "centro_treinamento": "CT King"}]
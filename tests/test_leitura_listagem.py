@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from workout_api.atleta import controller
+from workout_api.atleta.leitura import COLUNAS, select_origem
+from workout_api.atleta.models import AtletaLeituraModel, AtletaModel
+
+
+@pytest.fixture
+def leitura(db, monkeypatch):
+    # Copia os atletas para atletas_leitura e apaga a origem: só a leitura pela tabela desnormalizada os encontra
+    with Session(db) as session:
+        session.execute(insert(AtletaLeituraModel).from_select(COLUNAS, select_origem()))
+        session.execute(delete(AtletaModel))
+        session.commit()
+
+    monkeypatch.setattr(controller.settings, "LEITURA_ATLETAS", True)
+    monkeypatch.setattr(controller, "MODELO_LISTAGEM", AtletaLeituraModel)
+    monkeypatch.setattr(controller, "CAMPOS_LISTAGEM", controller.CAMPOS_LEITURA)
+
+
+def test_get_all_pela_leitura(client, leitura):
+    resposta = client.get("/atletas/get_all")
+    assert resposta.status_code == 200
+    [atleta] = resposta.json()["items"]
+    assert atleta["nome"] == "João"
+    assert atleta["categoria"] == {"nome": "Scale"}
+    assert atleta["centro_treinamento"] == {"nome": "CT King"}
+
+    resposta = client.get("/atletas/get_all", params={"fields": "nome,categoria,centro_treinamento"})
+    assert resposta.json()["items"] == [
+        {"nome": "João", "categoria": {"nome": "Scale"}, "centro_treinamento": {"nome": "CT King"}}
+    ]
+
+    resposta = client.get("/atletas/get_all", params={"categoria": True, "centro_treinamento": True})
+    assert resposta.json()["items"] == [{"categoria": "Scale", "centro_treinamento": "CT King"}]
+
+
+def test_query_pela_leitura(client, leitura):
+    resposta = client.get("/atletas/", params={"cpf": "12345678900"})
+    assert resposta.status_code == 200
+    [atleta] = resposta.json()
+    assert atleta["nome"] == "João"
+    assert atleta["categoria"] == {"nome": "Scale"}
+
+    resposta = client.get("/atletas/", params={"nome": "João", "fields": "cpf,centro_treinamento"})
+    assert resposta.json() == [{"cpf": "12345678900", "centro_treinamento": {"nome": "CT King"}}]
@@ -0,0 +1,163 @@
+import pytest
+from fastapi.testclient import TestClient
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from workout_api.config import database
+from workout_api.config.settings import settings
+from workout_api.contrib import tracing as tracing_api
+from workout_api.contrib.tracing import TailSamplingProcessor, TracedAsyncSession, configure_tracing, instrument_engine
+from workout_api.main import app
+
+MS = 1_000_000
+
+
+@pytest.fixture
+def tracing():
+    def criar(**kwargs):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(TailSamplingProcessor(SimpleSpanProcessor(exporter), **kwargs))
+        return provider.get_tracer("teste"), exporter
+
+    return criar
+
+
+def executar_trace(tracer, inicio=0, duracao_ms=10, erro=False):
+    # Um span raiz com um filho, com tempos explícitos em nanossegundos
+    raiz = tracer.start_span("raiz", start_time=inicio)
+    filho = tracer.start_span("filho", context=trace.set_span_in_context(raiz), start_time=inicio)
+    if erro:
+        filho.set_status(Status(StatusCode.ERROR))
+    filho.end(end_time=inicio + MS)
+    return raiz, inicio + duracao_ms * MS
+
+
+def nomes(exporter):
+    return [s.name for s in exporter.get_finished_spans()]
+
+
+def test_mantem_trace_com_erro(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=0)
+    raiz, fim = executar_trace(tracer, erro=True)
+    raiz.end(end_time=fim)
+    assert nomes(exporter) == ["filho", "raiz"]
+
+
+def test_mantem_trace_lento(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=100)
+    raiz, fim = executar_trace(tracer, duracao_ms=50)
+    raiz.end(end_time=fim)
+    assert nomes(exporter) == []
+
+    raiz, fim = executar_trace(tracer, duracao_ms=200)
+    raiz.end(end_time=fim)
+    assert nomes(exporter) == ["filho", "raiz"]
+
+
+def test_amostragem_por_fracao(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=0)
+    raiz, fim = executar_trace(tracer)
+    raiz.end(end_time=fim)
+    assert nomes(exporter) == []
+
+    tracer, exporter = tracing(sample_rate=1, latency_ms=0)
+    raiz, fim = executar_trace(tracer)
+    raiz.end(end_time=fim)
+    assert nomes(exporter) == ["filho", "raiz"]
+
+
+def test_limite_nao_remove_trace_com_erro(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=0, max_traces=1)
+    raiz_erro, fim_erro = executar_trace(tracer, erro=True)
+    raiz, fim = executar_trace(tracer)
+    raiz.end(end_time=fim)
+    raiz_erro.end(end_time=fim_erro)
+    assert nomes(exporter) == ["filho", "raiz"]
+    assert exporter.get_finished_spans()[0].status.status_code is StatusCode.ERROR
+
+
+def test_trace_abandonado_expira_por_idade(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=0, max_age_s=1)
+    executar_trace(tracer, erro=True)
+    executar_trace(tracer)
+
+    # Um span terminando 2s depois expira os traces anteriores; o que tinha erro é exportado
+    raiz, fim = executar_trace(tracer, inicio=2_000 * MS)
+    assert nomes(exporter) == ["filho"]
+    assert exporter.get_finished_spans()[0].status.status_code is StatusCode.ERROR
+
+
+def test_limite_com_todos_os_traces_com_erro(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=0, max_traces=1)
+    raiz_a, fim_a = executar_trace(tracer, erro=True)
+    raiz_b, fim_b = executar_trace(tracer, erro=True)
+
+    # O buffer não passa do limite: o trace mais antigo é exportado antes de terminar
+    assert nomes(exporter) == ["filho"]
+
+    raiz_a.end(end_time=fim_a)
+    raiz_b.end(end_time=fim_b)
+    assert nomes(exporter) == ["filho", "raiz", "filho", "raiz"]
+
+
+def test_raiz_atrasado_segue_a_decisao_do_trace(tracing):
+    tracer, exporter = tracing(sample_rate=0, latency_ms=0, max_age_s=1)
+    raiz_erro, fim_erro = executar_trace(tracer, erro=True)
+    executar_trace(tracer, inicio=2_000 * MS)
+    assert nomes(exporter) == ["filho"]
+
+    raiz_erro.end(end_time=fim_erro)
+    assert nomes(exporter) == ["filho", "raiz"]
+
+
+def test_raiz_atrasado_de_trace_descartado(tracing):
+    tracer, exporter = tracing(sample_rate=1, latency_ms=0, max_age_s=1)
+    raiz, fim = executar_trace(tracer)
+    executar_trace(tracer, inicio=2_000 * MS)
+
+    # O trace foi descartado sem o raiz; ele não é exportado sozinho depois
+    raiz.end(end_time=fim)
+    assert nomes(exporter) == []
+
+
+@pytest.fixture
+def app_com_tracing(db, monkeypatch):
+    # Configura o tracing como na inicialização da API, com o get_session real apontando para o SQLite
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_EXPORTER", "memory")
+    configure_tracing()
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db.url.database}", poolclass=NullPool)
+    instrument_engine(engine)
+    monkeypatch.setattr(database, "async_session", sessionmaker(engine, class_=TracedAsyncSession, expire_on_commit=False))
+
+    with TestClient(app) as client:
+        yield client, tracing_api.exporter
+
+
+def test_spans_da_rota_ate_o_statement(app_com_tracing):
+    client, exporter = app_com_tracing
+    assert client.post("/categorias/", json={"nome": "RX"}).status_code == 201
+
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    rota, sessao, commit, insert = (spans[n] for n in ["POST /categorias/", "db.session", "db.commit", "INSERT"])
+
+    assert rota.parent is None
+    assert sessao.parent.span_id == rota.context.span_id
+    assert commit.parent.span_id == sessao.context.span_id
+    assert insert.parent.span_id == commit.context.span_id
+    assert {s.context.trace_id for s in spans.values()} == {rota.context.trace_id}
+
+    assert rota.attributes["http.route"] == "/categorias/"
+    assert rota.attributes["http.response.status_code"] == 201
+    assert insert.attributes["db.statement"].startswith("INSERT INTO categorias")
+    assert insert.attributes["db.rowcount"] == 1
+    assert insert.attributes["db.system"] == "sqlite"
@@ -1,3 +1,3 @@
-from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.models import AtletaModel, AtletaLeituraModel
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
 from workout_api.categorias.models import CategoriaModel
\ No newline at end of file
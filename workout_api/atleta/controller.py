@@ -9,13 +9,48 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
-from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.models import AtletaLeituraModel, AtletaModel
 from workout_api.atleta.schemas import AtletaIn, AtletaOut, AtletaUpdate, AtletaFiltrado
 from workout_api.categorias.models import CategoriaModel
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.config.settings import settings
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.fields import Campo, FieldsQuery, build_schema, build_select, fetch_page, parse_fields, partial_response, to_schema
+from workout_api.contrib.tracing import TracedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
+
+# categoria e centro_treinamento só fazem join quando pedidos, retornando apenas o nome
+CAMPOS = {
+    "id": Campo(AtletaModel.id),
+    "created_at": Campo(AtletaModel.created_at),
+    "nome": Campo(AtletaModel.nome),
+    "cpf": Campo(AtletaModel.cpf),
+    "idade": Campo(AtletaModel.idade),
+    "peso": Campo(AtletaModel.peso),
+    "altura": Campo(AtletaModel.altura),
+    "sexo": Campo(AtletaModel.sexo),
+    "categoria": Campo(CategoriaModel.nome, join=AtletaModel.categoria, aninhado="nome"),
+    "centro_treinamento": Campo(CentroTreinamentoModel.nome, join=AtletaModel.centro_treinamento, aninhado="nome"),
+}
+
+# Mesmos campos lidos da tabela desnormalizada, sem nenhum join
+CAMPOS_LEITURA = {
+    "id": Campo(AtletaLeituraModel.id),
+    "created_at": Campo(AtletaLeituraModel.created_at),
+    "nome": Campo(AtletaLeituraModel.nome),
+    "cpf": Campo(AtletaLeituraModel.cpf),
+    "idade": Campo(AtletaLeituraModel.idade),
+    "peso": Campo(AtletaLeituraModel.peso),
+    "altura": Campo(AtletaLeituraModel.altura),
+    "sexo": Campo(AtletaLeituraModel.sexo),
+    "categoria": Campo(AtletaLeituraModel.categoria_nome, aninhado="nome"),
+    "centro_treinamento": Campo(AtletaLeituraModel.centro_treinamento_nome, aninhado="nome"),
+}
+
+MODELO_LISTAGEM, CAMPOS_LISTAGEM = (
+    (AtletaLeituraModel, CAMPOS_LEITURA) if settings.LEITURA_ATLETAS else (AtletaModel, CAMPOS)
+)
 
 @router.post(
     "/",
@@ -72,44 +107,46 @@ async def post(
 )
 async def get_all_atletas(
     db_session: DatabaseDependency,
-    nome: Optional[bool] = False,
-    categoria: Optional[bool] = False,
-    centro_treinamento: Optional[bool] = False,
+    fields: FieldsQuery = None,
+    nome: Optional[bool] = Query(False, deprecated=True),
+    categoria: Optional[bool] = Query(False, deprecated=True),
+    centro_treinamento: Optional[bool] = Query(False, deprecated=True),
     params: LimitOffsetParams = Depends()
 ) -> LimitOffsetPage:
-    if not nome and not categoria and not centro_treinamento:
-        pesquisa = (
-            select(AtletaModel)
-            .options(selectinload(AtletaModel.categoria), selectinload(AtletaModel.centro_treinamento))
-        )
-        
-        resultado = await paginate(db_session, pesquisa, params)
-        if not resultado:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"A lista de atletas está vazia"
-            )
-        atletas = [AtletaOut.model_validate(a, from_attributes=True) for a in resultado.items]
-        return LimitOffsetPage.create(items=atletas, total=resultado.total, params=params)
+    # Os filtros booleanos antigos selecionam as mesmas colunas de fields=nome,categoria,centro_treinamento,
+    # mas mantêm o formato plano de antes: {"categoria": "Scale"}
+    antigos = {"nome": nome, "categoria": categoria, "centro_treinamento": centro_treinamento}
+    legado = not fields and any(antigos.values())
+    if legado:
+        fields = ",".join(k for k, v in antigos.items() if v)
+
+    nomes = parse_fields(fields, CAMPOS_LISTAGEM)
+    parcial = nomes is not None
+    if parcial or settings.LEITURA_ATLETAS:
+        schema = build_schema(AtletaOut, nomes) if parcial else AtletaOut
+        nomes = nomes or tuple(CAMPOS_LISTAGEM)
+        cmd = build_select(MODELO_LISTAGEM, CAMPOS_LISTAGEM, nomes).order_by(MODELO_LISTAGEM.pk_id)
+        rows, total = await fetch_page(db_session, cmd, params)
+        if legado:
+            atletas = [dict(r._mapping) for r in rows]
+        else:
+            atletas = [to_schema(r, schema, CAMPOS_LISTAGEM, nomes) for r in rows]
+        pagina = LimitOffsetPage.create(items=atletas, total=total, params=params)
+        return partial_response(pagina) if parcial else pagina
+
+    pesquisa = (
+        select(AtletaModel)
+        .options(selectinload(AtletaModel.categoria), selectinload(AtletaModel.centro_treinamento))
+    )
     
-    else:
-        colunas = [AtletaModel.cpf]
-        colunas.append(AtletaModel.nome) if nome else None
-        colunas.append(CategoriaModel.nome.label("categoria")) if categoria else None
-        colunas.append(CentroTreinamentoModel.nome.label("centro_treinamento")) if centro_treinamento else None
-        
-        cmd = select(*colunas)
-        cmd = cmd.join(AtletaModel.categoria) if categoria else cmd
-        cmd = cmd.join(AtletaModel.centro_treinamento) if centro_treinamento else cmd
-        
-        resultado = await paginate(db_session, cmd, params=params)
-        atletas = []
-        for row in resultado.items:
-            d = dict(row._mapping)
-            d.pop("cpf")
-            atletas.append(d)
-            
-        return LimitOffsetPage.create(items=atletas, total=resultado.total, params=params)
+    resultado = await paginate(db_session, pesquisa, params)
+    if not resultado:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"A lista de atletas está vazia"
+        )
+    atletas = [AtletaOut.model_validate(a, from_attributes=True) for a in resultado.items]
+    return LimitOffsetPage.create(items=atletas, total=resultado.total, params=params)
     
 
 @router.get(
@@ -122,7 +159,8 @@ async def query(
     db_session: DatabaseDependency,
     id: Optional[UUID4] = Query(None),
     nome: Optional[str] = Query(None),
-    cpf: Optional[str] = Query(None)
+    cpf: Optional[str] = Query(None),
+    fields: FieldsQuery = None
 ) -> list[AtletaOut]:
     if id == None and nome == None and cpf == None:
         raise HTTPException(
@@ -135,6 +173,17 @@ async def query(
     if nome is not None: params["nome"] = nome
     if cpf is not None: params["cpf"] = cpf
     
+    nomes = parse_fields(fields, CAMPOS_LISTAGEM)
+    parcial = nomes is not None
+    if parcial or settings.LEITURA_ATLETAS:
+        schema = build_schema(AtletaOut, nomes) if parcial else AtletaOut
+        nomes = nomes or tuple(CAMPOS_LISTAGEM)
+        # where() em vez de filter_by(), que filtraria pela última tabela do join
+        cmd = build_select(MODELO_LISTAGEM, CAMPOS_LISTAGEM, nomes).where(*[getattr(MODELO_LISTAGEM, k) == v for k, v in params.items()])
+        rows = (await db_session.execute(cmd)).all()
+        atletas = [to_schema(r, schema, CAMPOS_LISTAGEM, nomes) for r in rows]
+        return partial_response(atletas) if parcial else atletas
+    
     atletas = (await db_session.execute(select(AtletaModel).filter_by(**params))).scalars().all()
     return atletas
 
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.atleta.models import AtletaLeituraModel, AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.config.database import async_session
+
+# Ordem das colunas compartilhada entre a origem (com joins) e a tabela de leitura
+COLUNAS = [
+    "pk_id", "id", "nome", "cpf", "idade", "peso", "altura", "sexo", "created_at",
+    "categoria_id", "categoria_nome", "centro_treinamento_id", "centro_treinamento_nome",
+]
+
+# Triggers criados pela migração 3b9c4d1a7e52, que mantêm a tabela de leitura sincronizada
+TRIGGERS = ["atletas_leitura_atleta", "atletas_leitura_categoria", "atletas_leitura_centro_treinamento"]
+
+
+def select_origem():
+    return (
+        select(
+            AtletaModel.pk_id, AtletaModel.id, AtletaModel.nome, AtletaModel.cpf,
+            AtletaModel.idade, AtletaModel.peso, AtletaModel.altura, AtletaModel.sexo,
+            AtletaModel.created_at, AtletaModel.categoria_id,
+            CategoriaModel.nome.label("categoria_nome"),
+            AtletaModel.centro_treinamento_id,
+            CentroTreinamentoModel.nome.label("centro_treinamento_nome"),
+        )
+        .join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+        .join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+    )
+
+
+def select_leitura():
+    return select(*[getattr(AtletaLeituraModel, c) for c in COLUNAS])
+
+
+async def rebuild(db_session: AsyncSession) -> int:
+    # Repopula a tabela de leitura a partir das tabelas normalizadas em uma única transação.
+    # O lock em SHARE MODE bloqueia as escritas (e os triggers delas) até o commit, senão um atleta
+    # inserido entre o DELETE e o INSERT seria gravado duas vezes. Os triggers não são recriados.
+    await db_session.execute(text("LOCK TABLE atletas, categorias, centros_treinamento IN SHARE MODE"))
+    await db_session.execute(delete(AtletaLeituraModel))
+    resultado = await db_session.execute(insert(AtletaLeituraModel).from_select(COLUNAS, select_origem()))
+    await db_session.commit()
+    return resultado.rowcount
+
+
+async def check(db_session: AsyncSession) -> dict[str, int]:
+    # faltando: linhas da origem ausentes ou desatualizadas na tabela de leitura
+    # sobrando: linhas da tabela de leitura que não existem mais na origem
+    # triggers: triggers de sincronização que não existem no banco
+    faltando = select_origem().except_(select_leitura()).subquery()
+    sobrando = select_leitura().except_(select_origem()).subquery()
+    existentes = (await db_session.execute(
+        text("SELECT tgname FROM pg_trigger WHERE NOT tgisinternal AND tgname = ANY(:nomes)"),
+        {"nomes": TRIGGERS}
+    )).scalars().all()
+    return {
+        "faltando": (await db_session.execute(select(func.count()).select_from(faltando))).scalar_one(),
+        "sobrando": (await db_session.execute(select(func.count()).select_from(sobrando))).scalar_one(),
+        "triggers": len(set(TRIGGERS) - set(existentes)),
+    }
+
+
+async def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Manutenção da tabela atletas_leitura")
+    parser.add_argument("comando", choices=["rebuild", "check"])
+    args = parser.parse_args(argv)
+
+    async with async_session() as session:
+        if args.comando == "rebuild":
+            print(f"atletas_leitura repopulada com {await rebuild(session)} atletas")
+            return 0
+
+        diferencas = await check(session)
+        print(
+            f"atletas_leitura: {diferencas['faltando']} faltando, {diferencas['sobrando']} sobrando, "
+            f"{diferencas['triggers']} triggers ausentes"
+        )
+        if diferencas["triggers"]:
+            print("Os triggers não são recriados pelo rebuild, aplique novamente a migração 3b9c4d1a7e52")
+        return 1 if any(diferencas.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -1,6 +1,6 @@
 from datetime import datetime
 from workout_api.contrib.models import BaseModel
-from sqlalchemy import Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Index, Integer, String, Float, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -18,4 +18,51 @@ class AtletaModel(BaseModel):
     categoria: Mapped["CategoriaModel"] = relationship(back_populates="atleta", lazy='selectin')
     categoria_id: Mapped[int] = mapped_column(ForeignKey("categorias.pk_id"))
     centro_treinamento: Mapped["CentroTreinamentoModel"] = relationship(back_populates="atleta", lazy="selectin")
-    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centros_treinamento.pk_id"))
\ No newline at end of file
+    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centros_treinamento.pk_id"))
+
+
+# Colunas devolvidas pela listagem e pela busca, incluídas nos índices de atletas_leitura
+COLUNAS_LEITURA = [
+    "pk_id", "id", "nome", "cpf", "idade", "peso", "altura", "sexo", "created_at",
+    "categoria_nome", "centro_treinamento_nome"
+]
+
+
+# Tabela de leitura desnormalizada (atleta + nomes da categoria e do centro de treinamento)
+# Mantida pelos triggers da migração e usada nas listagens para evitar os joins
+class AtletaLeituraModel(BaseModel):
+    __tablename__ = "atletas_leitura"
+    
+    pk_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    nome: Mapped[str] = mapped_column(String(50), nullable=False)
+    cpf: Mapped[str] = mapped_column(String(11), nullable=False)
+    idade: Mapped[int] = mapped_column(Integer, nullable=False)
+    peso: Mapped[float] = mapped_column(Float, nullable=False)
+    altura: Mapped[float] = mapped_column(Float, nullable=False)
+    sexo: Mapped[str] = mapped_column(String(1), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    categoria_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    categoria_nome: Mapped[str] = mapped_column(String(50), nullable=False)
+    centro_treinamento_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    centro_treinamento_nome: Mapped[str] = mapped_column(String(20), nullable=False)
+    
+    # Índices de cobertura: a listagem (por pk_id) e a busca por id, nome ou CPF
+    # são feitas com um único index-only scan, sem ler a tabela
+    __table_args__ = (
+        Index(
+            "ix_atletas_leitura_listagem", "pk_id",
+            postgresql_include=[c for c in COLUNAS_LEITURA if c != "pk_id"],
+        ),
+        Index(
+            "ix_atletas_leitura_id", "id",
+            postgresql_include=[c for c in COLUNAS_LEITURA if c != "id"],
+        ),
+        Index(
+            "ix_atletas_leitura_nome", "nome",
+            postgresql_include=[c for c in COLUNAS_LEITURA if c != "nome"],
+        ),
+        Index(
+            "ix_atletas_leitura_cpf", "cpf", unique=True,
+            postgresql_include=[c for c in COLUNAS_LEITURA if c != "cpf"],
+        ),
+    )
\ No newline at end of file
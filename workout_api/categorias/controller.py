@@ -7,12 +7,19 @@ from fastapi_pagination import LimitOffsetPage, Page, LimitOffsetParams
 from fastapi_pagination.ext.sqlalchemy import paginate
 from workout_api.categorias.schemas import CategoriaIn, CategoriaOut
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.fields import Campo, FieldsQuery, build_schema, build_select, fetch_page, parse_fields, partial_response, to_schema
+from workout_api.contrib.tracing import TracedRoute
 from workout_api.categorias.models import CategoriaModel
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
+
+CAMPOS = {
+    "id": Campo(CategoriaModel.id),
+    "nome": Campo(CategoriaModel.nome),
+}
 
 @router.post(
     "/",
@@ -50,7 +57,14 @@ async def post(
     status_code=status.HTTP_200_OK,
     response_model=LimitOffsetPage[CategoriaOut],
 )
-async def query(db_session: DatabaseDependency, params: LimitOffsetParams = Depends()) -> list[CategoriaOut]:
+async def query(db_session: DatabaseDependency, fields: FieldsQuery = None, params: LimitOffsetParams = Depends()) -> list[CategoriaOut]:
+    nomes = parse_fields(fields, CAMPOS)
+    if nomes:
+        schema = build_schema(CategoriaOut, nomes)
+        rows, total = await fetch_page(db_session, build_select(CategoriaModel, CAMPOS, nomes), params)
+        categorias = [to_schema(r, schema, CAMPOS, nomes) for r in rows]
+        return partial_response(LimitOffsetPage.create(items=categorias, total=total, params=params))
+
     resultado = (await paginate(db_session, select(CategoriaModel), params=params))
     categorias = [CategoriaOut.model_validate(r, from_attributes=True) for r in resultado.items]
     return LimitOffsetPage.create(items=categorias, total=resultado.total, params=params)
@@ -62,7 +76,18 @@ async def query(db_session: DatabaseDependency, params: LimitOffsetParams = Depe
     status_code=status.HTTP_200_OK,
     response_model=CategoriaOut
 )
-async def query(id: UUID4, db_session: DatabaseDependency) -> CategoriaOut:
+async def query(id: UUID4, db_session: DatabaseDependency, fields: FieldsQuery = None) -> CategoriaOut:
+    nomes = parse_fields(fields, CAMPOS)
+    if nomes:
+        cmd = build_select(CategoriaModel, CAMPOS, nomes).where(CategoriaModel.id == id)
+        row = (await db_session.execute(cmd)).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Categoria não encontrada no ID: {id}"
+            )
+        return partial_response(to_schema(row, build_schema(CategoriaOut, nomes), CAMPOS, nomes))
+
     categoria: CategoriaOut = (await db_session.execute(select(CategoriaModel).filter_by(id=id))).scalars().first()
     
     if not categoria:
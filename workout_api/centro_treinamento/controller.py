@@ -1,16 +1,26 @@
 from uuid import uuid4
 from fastapi import APIRouter, Body, Depends, status, HTTPException
-from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, paginate
+from fastapi_pagination import LimitOffsetPage, LimitOffsetParams
+from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import UUID4
 
 from workout_api.centro_treinamento.schemas import CentroTreinamentoIn, CentroTreinamentoOut
 from workout_api.contrib.dependencies import DatabaseDependency
+from workout_api.contrib.fields import Campo, FieldsQuery, build_schema, build_select, fetch_page, parse_fields, partial_response, to_schema
+from workout_api.contrib.tracing import TracedRoute
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
+
+CAMPOS = {
+    "id": Campo(CentroTreinamentoModel.id),
+    "nome": Campo(CentroTreinamentoModel.nome),
+    "endereco": Campo(CentroTreinamentoModel.endereco),
+    "proprietario": Campo(CentroTreinamentoModel.proprietario),
+}
 
 @router.post(
     "/",
@@ -48,7 +58,14 @@ async def post(
     status_code=status.HTTP_200_OK,
     response_model=LimitOffsetPage[CentroTreinamentoOut]
 )
-async def query(db_session: DatabaseDependency, params: LimitOffsetParams = Depends()) -> LimitOffsetPage[CentroTreinamentoOut]:
+async def query(db_session: DatabaseDependency, fields: FieldsQuery = None, params: LimitOffsetParams = Depends()) -> LimitOffsetPage[CentroTreinamentoOut]:
+    nomes = parse_fields(fields, CAMPOS)
+    if nomes:
+        schema = build_schema(CentroTreinamentoOut, nomes)
+        rows, total = await fetch_page(db_session, build_select(CentroTreinamentoModel, CAMPOS, nomes), params)
+        centros_treinamento = [to_schema(r, schema, CAMPOS, nomes) for r in rows]
+        return partial_response(LimitOffsetPage.create(items=centros_treinamento, total=total, params=params))
+
     resultado = await paginate(db_session, select(CentroTreinamentoModel), params=params)
     centros_treinamento = [CentroTreinamentoOut.model_validate(r, from_attributes=True) for r in resultado.items]
     return LimitOffsetPage.create(items=centros_treinamento, total=resultado.total, params=params)
@@ -60,7 +77,18 @@ async def query(db_session: DatabaseDependency, params: LimitOffsetParams = Depe
     status_code=status.HTTP_200_OK,
     response_model=CentroTreinamentoOut
 )
-async def query(id: UUID4, db_session: DatabaseDependency) -> CentroTreinamentoOut:
+async def query(id: UUID4, db_session: DatabaseDependency, fields: FieldsQuery = None) -> CentroTreinamentoOut:
+    nomes = parse_fields(fields, CAMPOS)
+    if nomes:
+        cmd = build_select(CentroTreinamentoModel, CAMPOS, nomes).where(CentroTreinamentoModel.id == id)
+        row = (await db_session.execute(cmd)).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Centro de treinamento não encontrado no ID: {id}"
+            )
+        return partial_response(to_schema(row, build_schema(CentroTreinamentoOut, nomes), CAMPOS, nomes))
+
     categoria: CentroTreinamentoOut = (await db_session.execute(select(CentroTreinamentoModel).filter_by(id=id))).scalars().first()
     
     if not categoria:
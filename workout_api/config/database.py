@@ -1,16 +1,19 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from workout_api.config.settings import settings
+from workout_api.contrib.tracing import TracedAsyncSession, instrument_engine, tracer
 
 engine = create_async_engine(settings.DB_URL, echo=False)
+instrument_engine(engine)
 async_session = sessionmaker(
     engine,
-    class_ = AsyncSession,
+    class_ = TracedAsyncSession,
     expire_on_commit=False
 )
 
 async def get_session() -> AsyncGenerator:
-    async with async_session() as session:
-        yield session
\ No newline at end of file
+    with tracer.start_as_current_span("db.session"):
+        async with async_session() as session:
+            yield session
\ No newline at end of file
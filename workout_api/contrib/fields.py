@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Any, Optional
+
+from fastapi import HTTPException, Query, status
+from fastapi_pagination import LimitOffsetParams
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, create_model
+from sqlalchemy import Row, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from workout_api.contrib.schemas import BaseSchema
+
+
+FieldsQuery = Annotated[
+    Optional[str],
+    Query(description="Campos separados por vírgula a serem retornados (ex.: nome,categoria)")
+]
+
+
+@dataclass(frozen=True)
+class Campo:
+    # coluna: atributo do model que será selecionado
+    # join: relacionamento necessário para alcançar a coluna (None se for da própria tabela)
+    # aninhado: chave do objeto aninhado no schema de saída (ex.: categoria -> {"nome": ...})
+    coluna: Any
+    join: Any = None
+    aninhado: Optional[str] = None
+
+
+def parse_fields(fields: Optional[str], campos: dict[str, Campo]) -> Optional[tuple[str, ...]]:
+    if not fields:
+        return None
+
+    nomes = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    invalidos = [n for n in nomes if n not in campos]
+    if not nomes or invalidos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos inválidos: {', '.join(invalidos) or fields}. Disponíveis: {', '.join(campos)}"
+        )
+
+    return nomes
+
+
+def build_select(model: Any, campos: dict[str, Campo], nomes: tuple[str, ...]) -> Select:
+    # Seleciona apenas as colunas pedidas e faz join somente com as tabelas necessárias,
+    # assim nenhum relacionamento (selectin) é carregado
+    cmd = select(*[campos[n].coluna.label(n) for n in nomes]).select_from(model)
+
+    joins = []
+    for n in nomes:
+        join = campos[n].join
+        # Comparação por identidade: == entre relacionamentos monta uma expressão SQL
+        if join is not None and not any(j is join for j in joins):
+            joins.append(join)
+            cmd = cmd.join(join)
+
+    return cmd
+
+
+async def fetch_page(db_session: AsyncSession, cmd: Select, params: LimitOffsetParams) -> tuple[list[Row], int]:
+    # O paginate() do fastapi_pagination valida os itens contra o response_model da rota (o schema completo),
+    # então a página das projeções é montada aqui mesmo
+    raw_params = params.to_raw_params().as_limit_offset()
+    total = (await db_session.execute(select(func.count()).select_from(cmd.order_by(None).subquery()))).scalar_one()
+    rows = (await db_session.execute(cmd.limit(raw_params.limit).offset(raw_params.offset))).all()
+    return list(rows), total
+
+
+def build_schema(base: type[BaseModel], nomes: tuple[str, ...]) -> type[BaseModel]:
+    # O cache é por conjunto de campos: fields=nome,cpf e fields=cpf,nome usam o mesmo schema
+    return _build_schema(base, frozenset(nomes))
+
+
+@lru_cache(maxsize=128)
+def _build_schema(base: type[BaseModel], nomes: frozenset[str]) -> type[BaseModel]:
+    definicoes = {n: (f.annotation, f) for n, f in base.model_fields.items() if n in nomes}
+    return create_model(f"{base.__name__}Parcial", __base__=BaseSchema, **definicoes)
+
+
+def to_schema(row: Any, schema: type[BaseModel], campos: dict[str, Campo], nomes: tuple[str, ...]) -> dict[str, Any]:
+    dados = {}
+    for n in nomes:
+        valor = row._mapping[n]
+        dados[n] = {campos[n].aninhado: valor} if campos[n].aninhado else valor
+
+    # Valida pelo schema e devolve os campos na ordem pedida
+    validado = schema.model_validate(dados)
+    return {n: getattr(validado, n) for n in nomes}
+
+
+def partial_response(conteudo: Any) -> JSONResponse:
+    # O response_model da rota descreve o objeto completo, então o retorno parcial
+    # é serializado diretamente, já validado pelo schema dinâmico
+    return JSONResponse(content=jsonable_encoder(conteudo))
@@ -0,0 +1,231 @@
+import importlib
+import random
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+from fastapi.routing import APIRoute
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from workout_api.config.settings import settings
+
+# Sem configure_tracing() o tracer é um no-op da API do OpenTelemetry
+tracer = trace.get_tracer("workout_api")
+
+# Exportador em uso, acessível para consultar os spans quando TRACING_EXPORTER=memory
+exporter: Optional[SpanExporter] = None
+
+
+class FileSpanExporter(SpanExporter):
+    # Grava um span por linha em JSON, sem precisar de um collector
+    def __init__(self, caminho: str):
+        self._caminho = caminho
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with self._lock, open(self._caminho, "a", encoding="utf-8") as arquivo:
+            for span in spans:
+                arquivo.write(span.to_json(indent=None) + "\n")
+        return SpanExportResult.SUCCESS
+
+
+class TailSamplingProcessor(SpanProcessor):
+    # Guarda os spans de cada trace até o span raiz terminar e então decide se exporta o trace inteiro:
+    # traces com erro ou mais lentos que TRACING_TAIL_LATENCY_MS são sempre mantidos,
+    # os demais numa fração TRACING_TAIL_SAMPLE_RATE.
+    # Traces cujo raiz não termina em max_age_s saem do buffer (exportados se já tiverem erro ou passado do
+    # limite de latência). Acima de max_traces sai o trace mais antigo sem erro e, se todos tiverem erro,
+    # o mais antigo é exportado antes do fim. Os spans que chegam depois seguem a decisão já tomada.
+    def __init__(
+        self,
+        processor: SpanProcessor,
+        sample_rate: float,
+        latency_ms: float,
+        max_traces: int = 1000,
+        max_age_s: float = 60,
+    ):
+        self._processor = processor
+        self._sample_rate = sample_rate
+        self._latency_ns = latency_ms * 1_000_000
+        self._max_traces = max_traces
+        self._max_age_ns = max_age_s * 1_000_000_000
+        # Ordenado pelo primeiro span recebido de cada trace
+        self._traces: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        # Decisão (exportar ou não) dos traces que saíram do buffer antes do span raiz terminar
+        self._decididos: OrderedDict[int, bool] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span, parent_context=None) -> None:
+        self._processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        exportar = []
+        raiz = span.parent is None or span.parent.is_remote
+        with self._lock:
+            if trace_id in self._decididos:
+                if self._decididos[trace_id]:
+                    exportar.append(span)
+                if raiz:
+                    del self._decididos[trace_id]
+            else:
+                self._traces.setdefault(trace_id, []).append(span)
+                if raiz:
+                    spans = self._traces.pop(trace_id)
+                    if self._manter(span, spans):
+                        exportar.extend(spans)
+
+            exportar.extend(self._remover_antigos(span.end_time))
+
+        for s in exportar:
+            self._processor.on_end(s)
+
+    def _remover_antigos(self, agora: int) -> list[ReadableSpan]:
+        exportar = []
+        while self._traces:
+            trace_id, spans = next(iter(self._traces.items()))
+            if agora - spans[0].start_time < self._max_age_ns:
+                break
+            manter = self._tem_erro(spans) or bool(self._latency_ns and self._max_age_ns >= self._latency_ns)
+            exportar.extend(self._decidir(trace_id, manter))
+
+        # Limite de memória: remove primeiro os traces sem erro; se só restarem traces com erro,
+        # os mais antigos são exportados antes de terminar
+        excedente = len(self._traces) - self._max_traces
+        if excedente > 0:
+            sem_erro = [t for t, spans in self._traces.items() if not self._tem_erro(spans)][:excedente]
+            for trace_id in sem_erro:
+                self._decidir(trace_id, False)
+            while len(self._traces) > self._max_traces:
+                exportar.extend(self._decidir(next(iter(self._traces)), True))
+
+        return exportar
+
+    def _decidir(self, trace_id: int, manter: bool) -> list[ReadableSpan]:
+        spans = self._traces.pop(trace_id)
+        self._decididos[trace_id] = manter
+        # Também limitado: um trace cujo raiz nunca chega não fica aqui para sempre
+        while len(self._decididos) > self._max_traces:
+            self._decididos.popitem(last=False)
+        return spans if manter else []
+
+    def _tem_erro(self, spans: list[ReadableSpan]) -> bool:
+        return any(s.status.status_code is StatusCode.ERROR for s in spans)
+
+    def _manter(self, raiz: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        if self._tem_erro(spans):
+            return True
+        if self._latency_ns and raiz.end_time - raiz.start_time >= self._latency_ns:
+            return True
+        return random.random() < self._sample_rate
+
+    def shutdown(self) -> None:
+        self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
+
+
+def build_exporter(nome: str) -> SpanExporter:
+    if nome == "memory":
+        return InMemorySpanExporter()
+    if nome == "file":
+        return FileSpanExporter(settings.TRACING_FILE)
+    if nome == "console":
+        return ConsoleSpanExporter()
+
+    # Qualquer outro exportador pode ser informado como "modulo:Classe"
+    modulo, _, classe = nome.partition(":")
+    return getattr(importlib.import_module(modulo), classe)()
+
+
+def configure_tracing() -> None:
+    global exporter
+    if not settings.TRACING_ENABLED:
+        return
+
+    exporter = build_exporter(settings.TRACING_EXPORTER)
+    processor = SimpleSpanProcessor(exporter) if settings.TRACING_EXPORTER == "memory" else BatchSpanProcessor(exporter)
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "workout_api"}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_HEAD_SAMPLE_RATE)),
+    )
+    provider.add_span_processor(
+        TailSamplingProcessor(processor, settings.TRACING_TAIL_SAMPLE_RATE, settings.TRACING_TAIL_LATENCY_MS)
+    )
+    trace.set_tracer_provider(provider)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    if not settings.TRACING_ENABLED:
+        return
+
+    # Um span por statement executado, com o texto e a quantidade de linhas
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        if context is None:
+            return
+        context._tracing_span = tracer.start_span(
+            statement.split(None, 1)[0].upper() if statement.strip() else "statement",
+            kind=SpanKind.CLIENT,
+            attributes={"db.system": conn.dialect.name, "db.statement": statement, "db.executemany": executemany},
+        )
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _depois(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_tracing_span", None)
+        if span is not None:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+            span.end()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _erro(exception_context):
+        span = getattr(exception_context.execution_context, "_tracing_span", None)
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+
+class TracedAsyncSession(AsyncSession):
+    # commit e rollback em spans próprios; os statements do flush ficam aninhados neles
+    async def commit(self) -> None:
+        with tracer.start_as_current_span("db.commit"):
+            await super().commit()
+
+    async def rollback(self) -> None:
+        with tracer.start_as_current_span("db.rollback"):
+            await super().rollback()
+
+
+class TracedRoute(APIRoute):
+    # O span envolve o app da rota inteiro, incluindo a abertura e o fechamento da sessão nas dependências
+    async def handle(self, scope, receive, send) -> None:
+        metodo = scope.get("method", "")
+        with tracer.start_as_current_span(f"{metodo} {self.path}", kind=SpanKind.SERVER) as span:
+            span.set_attribute("http.request.method", metodo)
+            span.set_attribute("http.route", self.path)
+
+            async def send_com_status(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            await super().handle(scope, receive, send_com_status)
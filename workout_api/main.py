@@ -1,7 +1,9 @@
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
+from workout_api.contrib.tracing import configure_tracing
 from workout_api.router import api_router
 
+configure_tracing()
 app = FastAPI(title="WorkoutApi")
 app.include_router(api_router)
 add_pagination(app)
\ No newline at end of file